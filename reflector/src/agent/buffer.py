@@ -0,0 +1,43 @@
+"""Bounded sample buffer for MIRROR STAGE REFLECTOR."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Deque, List
+
+from .telemetry import TelemetrySnapshot
+
+
+class SampleBuffer:
+  """FIFO of compact samples awaiting delivery; the oldest are dropped when full."""
+
+  def __init__(self, max_samples: int) -> None:
+    self._samples: Deque[TelemetrySnapshot] = deque(maxlen=max(1, max_samples))
+    self.dropped = 0
+    self.rejected = 0
+
+  def __len__(self) -> int:
+    return len(self._samples)
+
+  @property
+  def max_samples(self) -> int:
+    return self._samples.maxlen or 0
+
+  def append(self, sample: TelemetrySnapshot) -> None:
+    if len(self._samples) == self._samples.maxlen:
+      self.dropped += 1
+    self._samples.append(sample)
+
+  def peek(self, limit: int) -> List[TelemetrySnapshot]:
+    return list(islice(self._samples, limit))
+
+  def discard(self, count: int) -> None:
+    for _ in range(min(count, len(self._samples))):
+      self._samples.popleft()
+
+  def reject_head(self) -> None:
+    """Drop the oldest sample because the backend refused it, so it cannot block the queue."""
+    if self._samples:
+      self._samples.popleft()
+      self.rejected += 1
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 
 DEFAULT_INTERVAL_SECONDS = 1.0
 DEFAULT_COMMAND_POLL_SECONDS = 15.0
+DEFAULT_BUFFER_MAX_SAMPLES = 1000
 
 
 @dataclass(slots=True)
@@ -30,6 +31,7 @@ class AgentConfig:
   tags: Dict[str, str] = field(default_factory=dict)
   command_endpoint: Optional[str] = None
   command_poll_seconds: float = DEFAULT_COMMAND_POLL_SECONDS
+  buffer_max_samples: int = DEFAULT_BUFFER_MAX_SAMPLES
   logging: LoggingConfig = field(default_factory=LoggingConfig)
 
   @classmethod
@@ -51,6 +53,7 @@ class AgentConfig:
       tags={str(key): str(value) for key, value in data.get("tags", {}).items()},
       command_endpoint=data.get("command_endpoint"),
       command_poll_seconds=float(data.get("command_poll_seconds", DEFAULT_COMMAND_POLL_SECONDS)),
+      buffer_max_samples=int(data.get("buffer_max_samples", DEFAULT_BUFFER_MAX_SAMPLES)),
       logging=logging_config,
     )
 
@@ -6,8 +6,10 @@ import argparse
 import sys
 import asyncio
 
-from .runtime import run_agent
-from .telemetry import collect_snapshot
+from .buffer import SampleBuffer
+from .config import AgentConfig
+from .runtime import encode_batch, run_agent
+from .telemetry import TelemetryCollector, collect_snapshot
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -31,7 +33,94 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Override telemetry interval (seconds).",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--profile-memory",
+        type=int,
+        default=None,
+        metavar="TICKS",
+        help="Collect TICKS samples without sending and report RSS/allocations per tick.",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=("buffer", "steady"),
+        default="buffer",
+        help="buffer: keep every sample as during an outage; steady: encode and discard each tick.",
+    )
+    args = parser.parse_args(argv)
+    if args.profile_memory is not None and args.profile_memory < 1:
+        parser.error("--profile-memory must be at least 1")
+    return args
+
+
+def profile_memory(ticks: int, mode: str = "buffer", report_every: int = 500) -> None:
+    """Run ``ticks`` collections and print memory usage.
+
+    ``buffer`` mode keeps every sample in a SampleBuffer (an outage); ``steady`` mode collects,
+    encodes and discards each sample as ``telemetry_loop`` does when the backend is reachable.
+    RSS is read in a first untraced pass so tracemalloc's own bookkeeping is not counted; a
+    second pass under tracemalloc reports retained and transient bytes per tick.
+    """
+    import gc
+    import socket
+    import tracemalloc
+
+    import psutil
+
+    process = psutil.Process()
+    collector = TelemetryCollector(cpu_interval=0.0)
+    config = AgentConfig(endpoint="")
+    hostname = socket.gethostname()
+    buffer = SampleBuffer(ticks)
+
+    def tick() -> None:
+        sample = collector.collect()
+        if mode == "buffer":
+            buffer.append(sample)
+        else:
+            encode_batch([sample], config, hostname)
+
+    def checkpoint(index: int) -> bool:
+        return index % report_every == 0 or index == ticks
+
+    tick()  # warm up host info and psutil caches
+    buffer.discard(len(buffer))
+    gc.collect()
+
+    print(f"[{mode}] untraced pass")
+    print("ticks  buffered  rss_mib  rss_delta_kib  live_blocks/tick")
+    baseline_rss = process.memory_info().rss
+    baseline_blocks = sys.getallocatedblocks()
+    for index in range(1, ticks + 1):
+        tick()
+        if checkpoint(index):
+            rss = process.memory_info().rss
+            blocks = sys.getallocatedblocks()
+            print(
+                f"{index:5d}  {len(buffer):8d}  {rss / 1048576:7.1f}  {(rss - baseline_rss) / 1024:13.1f}"
+                f"  {(blocks - baseline_blocks) / index:16.1f}"
+            )
+
+    buffer.discard(len(buffer))
+    gc.collect()
+
+    print(f"[{mode}] tracemalloc pass")
+    print("ticks  buffered  retained_kib/tick  transient_kib/tick")
+    tracemalloc.start()
+    baseline_traced, _ = tracemalloc.get_traced_memory()
+    transient_total = 0
+    for index in range(1, ticks + 1):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        tick()
+        _, peak = tracemalloc.get_traced_memory()
+        transient_total += peak - before
+        if checkpoint(index):
+            traced, _ = tracemalloc.get_traced_memory()
+            print(
+                f"{index:5d}  {len(buffer):8d}  {(traced - baseline_traced) / 1024 / index:17.2f}"
+                f"  {transient_total / 1024 / index:18.2f}"
+            )
+    tracemalloc.stop()
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -44,6 +133,10 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(snapshot.to_payload(), indent=2))
         return 0
 
+    if args.profile_memory is not None:
+        profile_memory(args.profile_memory, args.profile_mode)
+        return 0
+
     try:
         asyncio.run(run_agent(config_path=args.config, interval_override=args.interval))
     except KeyboardInterrupt:
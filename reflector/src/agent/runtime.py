@@ -3,45 +3,125 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import socket
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
 
 from .config import AgentConfig, load_config
 from .logger import configure_logging
-from .telemetry import collect_snapshot
+from .buffer import SampleBuffer
+from .telemetry import TelemetryCollector, TelemetrySnapshot
 from .transport import CommandTransport, HttpTransport
 from .commands import CommandExecutor
 
 
+MAX_BATCH_SAMPLES = 100
+# The EGO backend uses Express' default 100kb JSON body limit; stay well under it.
+MAX_BATCH_BYTES = 64 * 1024
+# Statuses that mean the payload itself was refused (invalid or too large). Any other error,
+# including 401/403/404 from a wrong endpoint or proxy, is transient and keeps the buffer intact.
+PAYLOAD_REJECTION_STATUSES = frozenset({400, 413, 422})
+
+
+class SampleRejected(Exception):
+  """The backend refused the head sample on its own; it has been dropped from the buffer."""
+
+
+def render_sample(sample: TelemetrySnapshot, config: AgentConfig, hostname: str) -> Dict[str, Any]:
+  """Convert a buffered sample into its wire payload, applying config overrides."""
+  payload = sample.to_payload()
+  payload["hostname"] = hostname
+  if config.rack:
+    payload["rack"] = config.rack
+  if config.position:
+    payload["position"] = config.position
+
+  tags = payload.get("tags") or {}
+  tags.update(config.tags)
+  payload["tags"] = tags
+  return payload
+
+
+def encode_batch(
+  samples: List[TelemetrySnapshot],
+  config: AgentConfig,
+  hostname: str,
+  max_bytes: int = MAX_BATCH_BYTES,
+) -> Tuple[int, bytes]:
+  """Serialise the longest prefix of ``samples`` that fits in ``max_bytes`` (always at least one)."""
+  parts: List[bytes] = []
+  size = len(b'{"samples":[]}')
+  for sample in samples:
+    encoded = json.dumps(render_sample(sample, config, hostname), separators=(",", ":")).encode("utf-8")
+    if parts and size + len(encoded) + 1 > max_bytes:
+      break
+    parts.append(encoded)
+    size += len(encoded) + 1
+  return len(parts), b'{"samples":[' + b",".join(parts) + b"]}"
+
+
+def _rejection_status(error: requests.HTTPError) -> Optional[int]:
+  status = getattr(error.response, "status_code", None)
+  return status if status in PAYLOAD_REJECTION_STATUSES else None
+
+
+def send_buffered(buffer: SampleBuffer, transport: HttpTransport, config: AgentConfig, hostname: str, logger) -> int:
+  """Send one batch from the head of ``buffer`` and return how many samples were delivered.
+
+  Batches refused as a payload (400, 413, 422) are split in half and retried until a single
+  sample remains; that sample is then dropped so it cannot block the samples behind it, and
+  SampleRejected is raised so the caller backs off. At most one halving chain runs per call;
+  the rest of the buffer waits for the next tick. Other failures propagate and the batch stays
+  buffered.
+  """
+  limit = MAX_BATCH_SAMPLES
+  while len(buffer):
+    count, body = encode_batch(buffer.peek(limit), config, hostname)
+    try:
+      transport.send_encoded(body)
+    except requests.HTTPError as error:
+      status = _rejection_status(error)
+      if status is None:
+        raise
+      if count > 1:
+        limit = count // 2
+        logger.warning("Backend refused %s-sample batch (HTTP %s); retrying with %s", count, status, limit)
+        continue
+      buffer.reject_head()
+      raise SampleRejected(f"backend refused sample (HTTP {status}); dropped, {buffer.rejected} rejected so far") from error
+    buffer.discard(count)
+    return count
+  return 0
+
+
 async def telemetry_loop(config: AgentConfig, transport: HttpTransport, logger) -> None:
   interval = max(config.interval_seconds, 1.0)
   failure_count = 0
   hostname = config.hostname_override or socket.gethostname()
+  collector = TelemetryCollector()
+  buffer = SampleBuffer(config.buffer_max_samples)
 
   while True:
     started = time.perf_counter()
     try:
-      snapshot = collect_snapshot()
-      payload = snapshot.to_payload()
-      payload["hostname"] = hostname
-      if config.rack:
-        payload["rack"] = config.rack
-      if config.position:
-        payload["position"] = config.position
-
-      tags = payload.get("tags") or {}
-      tags.update(config.tags)
-      payload["tags"] = tags
-
-      response = transport.send_metrics({"samples": [payload]})
-      accepted = response.get("accepted")
-      logger.debug("Telemetry sent (%s samples accepted)", accepted)
+      buffer.append(collector.collect())
+      sent = send_buffered(buffer, transport, config, hostname, logger)
+      logger.debug("Telemetry sent (%s samples, %s buffered)", sent, len(buffer))
       failure_count = 0
     except Exception as error:
       failure_count += 1
-      logger.error("Telemetry send failed (attempt %s): %s", failure_count, error)
+      logger.error(
+        "Telemetry send failed (attempt %s, %s buffered, %s dropped, %s rejected): %s",
+        failure_count,
+        len(buffer),
+        buffer.dropped,
+        buffer.rejected,
+        error,
+      )
 
     elapsed = time.perf_counter() - started
     backoff = min(30.0, interval * max(1, failure_count)) if failure_count else interval
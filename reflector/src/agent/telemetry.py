@@ -1,203 +1,396 @@
-"""Telemetry collection utilities for MIRROR STAGE REFLECTORs."""
+"""Telemetry collection utilities for MIRROR STAGE REFLECTORs.
+
+Samples are kept in a compact internal form (slotted records plus
+``array``-backed numeric columns) so that buffered samples stay cheap; the
+JSON wire format is only materialised by ``TelemetrySnapshot.to_payload``.
+"""
 
 from __future__ import annotations
 
 import platform
 import socket
-from dataclasses import dataclass, asdict, field
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import psutil
 
+AGENT_VERSION = "0.1.0-dev"
+
+# Per-interface counters are stored flattened, INTERFACE_STRIDE values per row.
+INTERFACE_COUNTERS = (
+    "bytes_sent",
+    "bytes_recv",
+    "packets_sent",
+    "packets_recv",
+    "errin",
+    "errout",
+    "dropin",
+    "dropout",
+)
+INTERFACE_STRIDE = len(INTERFACE_COUNTERS)
+
+
+@dataclass(slots=True, frozen=True)
+class HostInfo:
+    """Static host facts, collected once per process and shared by every sample."""
+
+    platform: str
+    cpu_model: str
+    cpu_physical_cores: int
+    cpu_logical_cores: int
+    os_distro: str
+    os_release: str
+    os_kernel: str
+    system_model: str
+    system_manufacturer: str
+
+    @classmethod
+    def collect(cls) -> "HostInfo":
+        uname = platform.uname()
+        return cls(
+            platform=platform.platform(),
+            cpu_model=platform.processor() or platform.machine(),
+            cpu_physical_cores=psutil.cpu_count(logical=False) or psutil.cpu_count() or 0,
+            cpu_logical_cores=psutil.cpu_count() or 0,
+            os_distro=uname.system,
+            os_release=uname.release,
+            os_kernel=uname.version,
+            system_model=uname.machine,
+            system_manufacturer=getattr(uname, "node", None) or uname.system,
+        )
+
+
+@dataclass(slots=True)
+class DiskTable:
+    devices: Tuple[str, ...] = ()
+    mountpoints: Tuple[str, ...] = ()
+    fstypes: Tuple[str, ...] = ()
+    total_bytes: array = field(default_factory=partial(array, "Q"))
+    used_bytes: array = field(default_factory=partial(array, "Q"))
+    used_percent: array = field(default_factory=partial(array, "d"))
+
+    def to_payload(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "device": self.devices[index],
+                "mountpoint": self.mountpoints[index],
+                "fstype": self.fstypes[index],
+                "total_bytes": self.total_bytes[index],
+                "used_bytes": self.used_bytes[index],
+                "used_percent": self.used_percent[index],
+            }
+            for index in range(len(self.devices))
+        ]
+
+
+@dataclass(slots=True)
+class InterfaceTable:
+    names: Tuple[str, ...] = ()
+    counters: array = field(default_factory=partial(array, "Q"))
+    # 0 means the link speed is unknown, matching psutil's own convention.
+    speed_mbps: array = field(default_factory=partial(array, "l"))
+    # 1 = up, 0 = down, -1 = unknown.
+    is_up: array = field(default_factory=partial(array, "b"))
+
+    def primary_index(self) -> Optional[int]:
+        for index, state in enumerate(self.is_up):
+            if state == 1:
+                return index
+        return 0 if self.names else None
+
+    def to_payload(self) -> List[Dict[str, Any]]:
+        result: List[Dict[str, Any]] = []
+        for index, name in enumerate(self.names):
+            row: Dict[str, Any] = {"name": name}
+            offset = index * INTERFACE_STRIDE
+            for column, key in enumerate(INTERFACE_COUNTERS):
+                row[key] = self.counters[offset + column]
+            row["speed_mbps"] = self.speed_mbps[index] or None
+            state = self.is_up[index]
+            row["is_up"] = None if state < 0 else bool(state)
+            result.append(row)
+        return result
+
+
+@dataclass(slots=True)
+class ProcessTable:
+    pids: array = field(default_factory=partial(array, "l"))
+    names: Tuple[Optional[str], ...] = ()
+    usernames: Tuple[Optional[str], ...] = ()
+    cpu_percent: array = field(default_factory=partial(array, "d"))
+    memory_percent: array = field(default_factory=partial(array, "d"))
+
+    def to_payload(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "pid": self.pids[index],
+                "name": self.names[index],
+                "username": self.usernames[index],
+                "cpu_percent": self.cpu_percent[index],
+                "memory_percent": self.memory_percent[index],
+            }
+            for index in range(len(self.pids))
+        ]
+
+
+@dataclass(slots=True)
+class TemperatureTable:
+    labels: Tuple[str, ...] = ()
+    values: array = field(default_factory=partial(array, "d"))
+
+    def to_payload(self) -> Dict[str, float]:
+        return dict(zip(self.labels, self.values))
+
+    def hottest(self, keywords: Tuple[str, ...]) -> Optional[float]:
+        matches = [
+            value
+            for label, value in zip(self.labels, self.values)
+            if any(keyword in label.lower() for keyword in keywords)
+        ]
+        if matches:
+            return float(max(matches))
+        return None
+
 
 @dataclass(slots=True)
 class TelemetrySnapshot:
     hostname: str
-    timestamp: str
+    timestamp: float
     cpu_load: float
     memory_used_percent: float
     load_average: float
     uptime_seconds: int
     net_bytes_tx: int
     net_bytes_rx: int
-    extras: Dict[str, Any] = field(default_factory=dict)
+    host: HostInfo
+    cpu_per_core: array
+    memory_total_bytes: int
+    memory_available_bytes: int
+    swap_used_percent: Optional[float]
+    disks: DiskTable
+    interfaces: InterfaceTable
+    temperatures: TemperatureTable
+    top_processes: ProcessTable
 
     def to_payload(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        extras = payload.pop("extras", {})
-        payload["agent_version"] = "0.1.0-dev"
-        payload["platform"] = platform.platform()
-        payload.update(extras)
+        host = self.host
+        payload: Dict[str, Any] = {
+            "hostname": self.hostname,
+            "timestamp": datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat(),
+            "cpu_load": self.cpu_load,
+            "memory_used_percent": self.memory_used_percent,
+            "load_average": self.load_average,
+            "uptime_seconds": self.uptime_seconds,
+            "net_bytes_tx": self.net_bytes_tx,
+            "net_bytes_rx": self.net_bytes_rx,
+            "agent_version": AGENT_VERSION,
+            "platform": host.platform,
+            "cpu_per_core": self.cpu_per_core.tolist(),
+            "cpu_physical_cores": host.cpu_physical_cores,
+            "cpu_logical_cores": host.cpu_logical_cores,
+            "cpu_model": host.cpu_model,
+            "memory_total_bytes": self.memory_total_bytes,
+            "memory_available_bytes": self.memory_available_bytes,
+            "swap_used_percent": self.swap_used_percent,
+            "disks": self.disks.to_payload(),
+            "interfaces": self.interfaces.to_payload(),
+            "temperatures": self.temperatures.to_payload(),
+        }
+        cpu_temp = self.temperatures.hottest(("cpu", "package", "core"))
+        if cpu_temp is not None:
+            payload["cpu_temperature"] = cpu_temp
+        gpu_temp = self.temperatures.hottest(("gpu", "graphics", "video"))
+        if gpu_temp is not None:
+            payload["gpu_temperature"] = gpu_temp
+        payload["top_processes"] = self.top_processes.to_payload()
+        payload["os_distro"] = host.os_distro
+        payload["os_release"] = host.os_release
+        payload["os_kernel"] = host.os_kernel
+        payload["system_model"] = host.system_model
+        payload["system_manufacturer"] = host.system_manufacturer
+
+        tags: Dict[str, str] = {}
+        primary = self.interfaces.primary_index()
+        if primary is not None:
+            tags["primary_interface"] = self.interfaces.names[primary]
+            speed_mbps = self.interfaces.speed_mbps[primary]
+            if speed_mbps:
+                tags["primary_interface_speed_mbps"] = str(speed_mbps)
+                payload["primary_interface_speed_mbps"] = speed_mbps
+        if self.disks.devices:
+            tags["primary_disk"] = self.disks.devices[0]
+        if tags:
+            payload["tags"] = tags
         return payload
 
 
-def collect_snapshot() -> TelemetrySnapshot:
-    """Collect a minimal telemetry snapshot from the current host."""
-    cpu_load = psutil.cpu_percent(interval=0.1)
-    memory = psutil.virtual_memory()
-    uptime_seconds = int(datetime.now(timezone.utc).timestamp() - psutil.boot_time())
-    load_average = psutil.getloadavg()[0] if hasattr(psutil, "getloadavg") else 0.0
-    net = psutil.net_io_counters()
-    extras = _collect_extras()
-
-    return TelemetrySnapshot(
-        hostname=socket.gethostname(),
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        cpu_load=cpu_load,
-        memory_used_percent=memory.percent,
-        load_average=float(load_average),
-        uptime_seconds=uptime_seconds,
-        net_bytes_tx=net.bytes_sent,
-        net_bytes_rx=net.bytes_recv,
-        extras=extras,
-    )
+class TelemetryCollector:
+    """Collects compact samples, reusing static host facts and label tuples between ticks.
 
+    Numeric columns are fresh arrays per sample so that buffered samples stay
+    independent; string columns are shared with the previous tick whenever the
+    set of disks, interfaces or sensors is unchanged.
+    """
 
-def _collect_extras() -> Dict[str, Any]:
-    extras: Dict[str, Any] = {}
+    def __init__(self, cpu_interval: float = 0.1) -> None:
+        self.cpu_interval = cpu_interval
+        self._host: Optional[HostInfo] = None
+        self._boot_time: Optional[float] = None
+        self._labels: Dict[str, Tuple[Any, ...]] = {}
 
-  try:
-    per_cpu = psutil.cpu_percent(percpu=True)
-    extras["cpu_per_core"] = per_cpu
-  except Exception:
-    extras["cpu_per_core"] = []
+    def collect(self) -> TelemetrySnapshot:
+        if self._host is None:
+            self._host = HostInfo.collect()
+            self._boot_time = psutil.boot_time()
 
-  extras["cpu_physical_cores"] = psutil.cpu_count(logical=False) or psutil.cpu_count() or 0
-  extras["cpu_logical_cores"] = psutil.cpu_count() or 0
-  extras["cpu_model"] = platform.processor() or platform.machine()
+        cpu_load = psutil.cpu_percent(interval=self.cpu_interval)
+        try:
+            cpu_per_core = array("d", psutil.cpu_percent(percpu=True))
+        except Exception:
+            cpu_per_core = array("d")
 
-  try:
-    memory = psutil.virtual_memory()
-    extras["memory_total_bytes"] = memory.total
-    extras["memory_available_bytes"] = memory.available
-    except Exception:
-        extras.setdefault("memory_total_bytes", 0)
-        extras.setdefault("memory_available_bytes", 0)
+        memory = psutil.virtual_memory()
+        try:
+            swap_used_percent: Optional[float] = psutil.swap_memory().percent
+        except Exception:
+            swap_used_percent = None
+        load_average = psutil.getloadavg()[0] if hasattr(psutil, "getloadavg") else 0.0
+        net = psutil.net_io_counters()
+        now = time.time()
 
-    try:
-        swap = psutil.swap_memory()
-        extras["swap_used_percent"] = swap.percent
-    except Exception:
-        extras["swap_used_percent"] = None
-
-  disks = _collect_disk_usage()
-  interfaces = _collect_interface_stats()
-  extras["disks"] = disks
-  extras["interfaces"] = interfaces
-  extras["temperatures"] = _collect_temperatures()
-  temps = extras["temperatures"]
-  cpu_temp = _extract_temperature(temps, ("cpu", "package", "core"))
-  if cpu_temp is not None:
-    extras["cpu_temperature"] = cpu_temp
-  gpu_temp = _extract_temperature(temps, ("gpu", "graphics", "video"))
-  if gpu_temp is not None:
-    extras["gpu_temperature"] = gpu_temp
-  extras["top_processes"] = _collect_top_processes()
-
-  uname = platform.uname()
-  extras["os_distro"] = uname.system
-  extras["os_release"] = uname.release
-  extras["os_kernel"] = uname.version
-  extras["system_model"] = uname.machine
-  extras["system_manufacturer"] = getattr(uname, "node", None) or uname.system
-
-  tags: Dict[str, str] = {}
-  primary_interface = next((iface for iface in interfaces if iface.get("is_up")), None) or (interfaces[0] if interfaces else None)
-  if primary_interface:
-    tags["primary_interface"] = primary_interface["name"]
-    speed_mbps = primary_interface.get("speed_mbps")
-    if speed_mbps:
-      tags["primary_interface_speed_mbps"] = str(speed_mbps)
-      extras["primary_interface_speed_mbps"] = speed_mbps
-    if disks:
-        tags["primary_disk"] = disks[0]["device"]
-    if tags:
-        extras["tags"] = tags
-
-    return extras
-
-
-def _collect_disk_usage() -> List[Dict[str, Any]]:
-    disks: List[Dict[str, Any]] = []
-    try:
-        for part in psutil.disk_partitions(all=False):
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-            except PermissionError:
-                continue
-            disks.append(
-                {
-                    "device": part.device,
-                    "mountpoint": part.mountpoint,
-                    "fstype": part.fstype,
-                    "total_bytes": usage.total,
-                    "used_bytes": usage.used,
-                    "used_percent": usage.percent,
-                }
-            )
-    except Exception:
-        return []
-    return disks
+        return TelemetrySnapshot(
+            hostname=sys.intern(socket.gethostname()),
+            timestamp=now,
+            cpu_load=cpu_load,
+            memory_used_percent=memory.percent,
+            load_average=float(load_average),
+            uptime_seconds=int(now - (self._boot_time or now)),
+            net_bytes_tx=net.bytes_sent,
+            net_bytes_rx=net.bytes_recv,
+            host=self._host,
+            cpu_per_core=cpu_per_core,
+            memory_total_bytes=memory.total,
+            memory_available_bytes=memory.available,
+            swap_used_percent=swap_used_percent,
+            disks=self._collect_disks(),
+            interfaces=self._collect_interfaces(),
+            temperatures=self._collect_temperatures(),
+            top_processes=_collect_top_processes(),
+        )
 
+    def _reuse(self, key: str, values: Sequence[Any]) -> Tuple[Any, ...]:
+        """Return the previous tick's tuple for ``key`` if it holds the same values."""
+        previous = self._labels.get(key)
+        if previous is not None and len(previous) == len(values) and all(
+            old == new for old, new in zip(previous, values)
+        ):
+            return previous
+        current = tuple(values)
+        self._labels[key] = current
+        return current
 
-def _collect_interface_stats() -> List[Dict[str, Any]]:
-    interfaces: List[Dict[str, Any]] = []
-    try:
-        io_counters = psutil.net_io_counters(pernic=True)
-        stats = psutil.net_if_stats()
-        for name, counters in io_counters.items():
-            iface_stats = stats.get(name)
-            interfaces.append(
-                {
-                    "name": name,
-                    "bytes_sent": counters.bytes_sent,
-                    "bytes_recv": counters.bytes_recv,
-                    "packets_sent": counters.packets_sent,
-                    "packets_recv": counters.packets_recv,
-                    "errin": counters.errin,
-                    "errout": counters.errout,
-                    "dropin": counters.dropin,
-                    "dropout": counters.dropout,
-                    "speed_mbps": iface_stats.speed if iface_stats and iface_stats.speed else None,
-                    "is_up": iface_stats.isup if iface_stats else None,
-                }
-            )
-    except Exception:
-        return []
-    return interfaces
-
-
-def _collect_temperatures() -> Dict[str, float]:
-  temps: Dict[str, float] = {}
-  if not hasattr(psutil, "sensors_temperatures"):
-    return temps
-  try:
-        sensors = psutil.sensors_temperatures()
-        for label, entries in sensors.items():
-            if not entries:
-                continue
-            # take the hottest reading per sensor bank
-            hottest = max(entries, key=lambda entry: entry.current if entry.current is not None else float("-inf"))
-            if hottest.current is None:
-                continue
-            key = f"{label}:{hottest.label or hottest.sensor or 'temp'}"
-            temps[key] = float(hottest.current)
-    except Exception:
-        return {}
-  return temps
+    def _collect_disks(self) -> DiskTable:
+        devices: List[str] = []
+        mountpoints: List[str] = []
+        fstypes: List[str] = []
+        total_bytes: List[int] = []
+        used_bytes: List[int] = []
+        used_percent: List[float] = []
+        try:
+            for part in psutil.disk_partitions(all=False):
+                try:
+                    usage = psutil.disk_usage(part.mountpoint)
+                except PermissionError:
+                    continue
+                devices.append(part.device)
+                mountpoints.append(part.mountpoint)
+                fstypes.append(part.fstype)
+                total_bytes.append(usage.total)
+                used_bytes.append(usage.used)
+                used_percent.append(usage.percent)
+        except Exception:
+            return DiskTable()
+        return DiskTable(
+            devices=self._reuse("disk_devices", devices),
+            mountpoints=self._reuse("disk_mountpoints", mountpoints),
+            fstypes=self._reuse("disk_fstypes", fstypes),
+            total_bytes=array("Q", total_bytes),
+            used_bytes=array("Q", used_bytes),
+            used_percent=array("d", used_percent),
+        )
 
+    def _collect_interfaces(self) -> InterfaceTable:
+        names: List[str] = []
+        counters: List[int] = []
+        speed_mbps: List[int] = []
+        is_up: List[int] = []
+        try:
+            io_counters = psutil.net_io_counters(pernic=True)
+            stats = psutil.net_if_stats()
+            for name, nic in io_counters.items():
+                iface_stats = stats.get(name)
+                names.append(name)
+                counters.extend(
+                    (
+                        nic.bytes_sent,
+                        nic.bytes_recv,
+                        nic.packets_sent,
+                        nic.packets_recv,
+                        nic.errin,
+                        nic.errout,
+                        nic.dropin,
+                        nic.dropout,
+                    )
+                )
+                speed_mbps.append(iface_stats.speed if iface_stats and iface_stats.speed else 0)
+                is_up.append(-1 if iface_stats is None else int(bool(iface_stats.isup)))
+        except Exception:
+            return InterfaceTable()
+        return InterfaceTable(
+            names=self._reuse("interface_names", names),
+            counters=array("Q", counters),
+            speed_mbps=array("l", speed_mbps),
+            is_up=array("b", is_up),
+        )
 
-def _extract_temperature(temps: Dict[str, float], keywords: Tuple[str, ...]) -> Optional[float]:
-  if not temps:
-    return None
-  matches = [value for key, value in temps.items() if any(keyword in key.lower() for keyword in keywords)]
-  if matches:
-    return float(max(matches))
-  return None
+    def _collect_temperatures(self) -> TemperatureTable:
+        if not hasattr(psutil, "sensors_temperatures"):
+            return TemperatureTable()
+        labels: List[str] = []
+        values: List[float] = []
+        try:
+            sensors = psutil.sensors_temperatures()
+            for label, entries in sensors.items():
+                if not entries:
+                    continue
+                # take the hottest reading per sensor bank
+                hottest = max(entries, key=lambda entry: entry.current if entry.current is not None else float("-inf"))
+                if hottest.current is None:
+                    continue
+                labels.append(f"{label}:{hottest.label or hottest.sensor or 'temp'}")
+                values.append(float(hottest.current))
+        except Exception:
+            return TemperatureTable()
+        return TemperatureTable(labels=self._reuse("temperature_labels", labels), values=array("d", values))
 
 
-def _collect_top_processes(limit: int = 5) -> List[Dict[str, Any]]:
+_default_collector: Optional[TelemetryCollector] = None
+
+
+def collect_snapshot() -> TelemetrySnapshot:
+    """Collect a minimal telemetry snapshot from the current host."""
+    global _default_collector
+    if _default_collector is None:
+        _default_collector = TelemetryCollector()
+    return _default_collector.collect()
+
+
+def _collect_top_processes(limit: int = 5) -> ProcessTable:
     processes: List[Tuple[float, psutil.Process]] = []
     try:
         for proc in psutil.process_iter(attrs=["pid", "name"]):
@@ -207,16 +400,34 @@ def _collect_top_processes(limit: int = 5) -> List[Dict[str, Any]]:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
     except Exception:
-        return []
+        return ProcessTable()
 
     top = sorted(processes, key=lambda item: item[0], reverse=True)[:limit]
-    result: List[Dict[str, Any]] = []
+    pids: List[int] = []
+    names: List[Optional[str]] = []
+    usernames: List[Optional[str]] = []
+    cpu_percent: List[float] = []
+    memory_percent: List[float] = []
     for cpu, proc in top:
         try:
             info = proc.as_dict(attrs=["pid", "name", "username"])
-            info["cpu_percent"] = cpu
-            info["memory_percent"] = proc.memory_percent()
-            result.append(info)
+            memory = proc.memory_percent()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
-    return result
+        pids.append(info["pid"])
+        names.append(_intern(info["name"]))
+        usernames.append(_intern(info["username"]))
+        cpu_percent.append(cpu)
+        memory_percent.append(memory)
+    return ProcessTable(
+        pids=array("l", pids),
+        names=tuple(names),
+        usernames=tuple(usernames),
+        cpu_percent=array("d", cpu_percent),
+        memory_percent=array("d", memory_percent),
+    )
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Process names and usernames repeat across ticks; share one copy between buffered samples.
+    return sys.intern(value) if isinstance(value, str) else value
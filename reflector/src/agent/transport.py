@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any, Dict, Optional
 
@@ -14,7 +15,16 @@ class HttpTransport:
     self.logger = logger or logging.getLogger("reflector.transport")
 
   def send_metrics(self, payload: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
-    response = requests.post(self.metrics_endpoint, json=payload, timeout=timeout)
+    return self.send_encoded(json.dumps(payload).encode("utf-8"), timeout=timeout)
+
+  def send_encoded(self, body: bytes, timeout: float = 5.0) -> Dict[str, Any]:
+    """POST an already-serialised JSON batch, so callers can size it before sending."""
+    response = requests.post(
+      self.metrics_endpoint,
+      data=body,
+      headers={"Content-Type": "application/json"},
+      timeout=timeout,
+    )
     response.raise_for_status()
     return response.json()
 
@@ -0,0 +1,49 @@
+import unittest
+
+from agent.buffer import SampleBuffer
+
+
+class SampleBufferTest(unittest.TestCase):
+  def test_drops_oldest_when_full(self) -> None:
+    buffer = SampleBuffer(3)
+    for sample in range(5):
+      buffer.append(sample)
+
+    self.assertEqual(len(buffer), 3)
+    self.assertEqual(buffer.dropped, 2)
+    self.assertEqual(buffer.peek(10), [2, 3, 4])
+
+  def test_peek_does_not_consume(self) -> None:
+    buffer = SampleBuffer(5)
+    for sample in range(4):
+      buffer.append(sample)
+
+    self.assertEqual(buffer.peek(2), [0, 1])
+    self.assertEqual(len(buffer), 4)
+
+  def test_discard_removes_from_head(self) -> None:
+    buffer = SampleBuffer(5)
+    for sample in range(4):
+      buffer.append(sample)
+
+    buffer.discard(3)
+    self.assertEqual(buffer.peek(10), [3])
+    buffer.discard(10)
+    self.assertEqual(len(buffer), 0)
+
+  def test_reject_head_counts_separately_from_dropped(self) -> None:
+    buffer = SampleBuffer(2)
+    buffer.append("poison")
+    buffer.append("ok")
+
+    buffer.reject_head()
+    self.assertEqual(buffer.peek(10), ["ok"])
+    self.assertEqual(buffer.rejected, 1)
+    self.assertEqual(buffer.dropped, 0)
+
+  def test_capacity_is_at_least_one(self) -> None:
+    self.assertEqual(SampleBuffer(0).max_samples, 1)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,189 @@
+import json
+import logging
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+import requests
+
+from agent.buffer import SampleBuffer
+from agent.config import AgentConfig
+from agent.runtime import MAX_BATCH_BYTES, SampleRejected, encode_batch, render_sample, send_buffered
+from agent.telemetry import TelemetryCollector
+
+LOGGER = logging.getLogger("reflector.tests")
+
+# Fields the EGO backend's MetricSampleSchema (ego/backend/src/metrics/metrics.dto.ts) requires.
+REQUIRED_STRINGS = ("hostname", "timestamp", "agent_version", "platform")
+REQUIRED_NUMBERS = ("cpu_load", "memory_used_percent", "load_average", "uptime_seconds")
+# Optional schema fields: when present they must be numbers (zod's optional() rejects null).
+OPTIONAL_NUMBERS = (
+  "gpu_temperature",
+  "cpu_temperature",
+  "net_bytes_tx",
+  "net_bytes_rx",
+  "memory_total_bytes",
+  "memory_available_bytes",
+  "cpu_physical_cores",
+  "cpu_logical_cores",
+  "primary_interface_speed_mbps",
+)
+OPTIONAL_STRINGS = (
+  "rack",
+  "system_manufacturer",
+  "system_model",
+  "cpu_model",
+  "os_distro",
+  "os_release",
+  "os_kernel",
+)
+
+
+def _is_number(value) -> bool:
+  return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class FakeTransport:
+  """Refuses any batch containing a sample in ``poison`` and any batch over ``max_samples``."""
+
+  def __init__(self, max_samples: int = 1000, poison=(), failure: int = 0) -> None:
+    self.max_samples = max_samples
+    self.poison = set(poison)
+    self.failure = failure
+    self.attempts = []
+    self.batches = []
+
+  def send_encoded(self, body: bytes, timeout: float = 5.0):
+    samples = json.loads(body)["samples"]
+    uptimes = [sample["uptime_seconds"] for sample in samples]
+    self.attempts.append(len(samples))
+    if self.failure:
+      self._raise(self.failure)
+    if len(samples) > self.max_samples:
+      self._raise(413)
+    if self.poison.intersection(uptimes):
+      self._raise(400)
+    self.batches.append(uptimes)
+    return {"accepted": len(samples)}
+
+  @staticmethod
+  def _raise(status: int) -> None:
+    raise requests.HTTPError(f"HTTP {status}", response=SimpleNamespace(status_code=status))
+
+
+class RuntimeTest(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.collector = TelemetryCollector(cpu_interval=0.0)
+    cls.config = AgentConfig(
+      endpoint="http://127.0.0.1:3000/api/metrics/batch",
+      rack="Rack-A",
+      position={"x": 1.0, "y": 0.0, "z": -1.0},
+      tags={"environment": "test"},
+    )
+
+  def _buffer(self, count: int) -> SampleBuffer:
+    # uptime_seconds doubles as a sample id for the fake transport.
+    buffer = SampleBuffer(count)
+    for index in range(count):
+      sample = self.collector.collect()
+      sample.uptime_seconds = index
+      buffer.append(sample)
+    return buffer
+
+  def test_rendered_sample_matches_backend_schema(self) -> None:
+    payload = render_sample(self.collector.collect(), self.config, "rack-a-01")
+    payload = json.loads(json.dumps(payload))
+
+    for key in REQUIRED_STRINGS:
+      self.assertIsInstance(payload[key], str, key)
+      self.assertTrue(payload[key], key)
+    for key in REQUIRED_NUMBERS:
+      self.assertTrue(_is_number(payload[key]), key)
+    for key in OPTIONAL_NUMBERS:
+      if key in payload:
+        self.assertTrue(_is_number(payload[key]), key)
+    for key in OPTIONAL_STRINGS:
+      if key in payload:
+        self.assertIsInstance(payload[key], str, key)
+
+    datetime.fromisoformat(payload["timestamp"])
+    self.assertGreaterEqual(payload["cpu_load"], 0)
+    self.assertTrue(0 <= payload["memory_used_percent"] <= 100)
+    self.assertGreaterEqual(payload["uptime_seconds"], 0)
+    self.assertEqual(payload["hostname"], "rack-a-01")
+    self.assertEqual(payload["rack"], "Rack-A")
+    self.assertEqual(payload["position"], {"x": 1.0, "y": 0.0, "z": -1.0})
+
+    # tags must be a string record; extractCapacityGbps reads primary_interface_speed_mbps from it.
+    tags = payload["tags"]
+    self.assertTrue(all(isinstance(value, str) for value in tags.values()))
+    self.assertEqual(tags["environment"], "test")
+    if "primary_interface_speed_mbps" in tags:
+      self.assertEqual(float(tags["primary_interface_speed_mbps"]), payload["primary_interface_speed_mbps"])
+
+  def test_encode_batch_respects_byte_limit(self) -> None:
+    samples = self._buffer(20).peek(20)
+    single = len(encode_batch(samples[:1], self.config, "host")[1])
+
+    count, body = encode_batch(samples, self.config, "host", max_bytes=single * 3)
+    self.assertLessEqual(len(body), single * 3)
+    self.assertGreaterEqual(count, 1)
+    self.assertLess(count, 20)
+    self.assertEqual(len(json.loads(body)["samples"]), count)
+
+    count, body = encode_batch(samples, self.config, "host")
+    self.assertLessEqual(len(body), MAX_BATCH_BYTES)
+
+  def test_encode_batch_always_sends_one_sample(self) -> None:
+    count, body = encode_batch(self._buffer(2).peek(2), self.config, "host", max_bytes=1)
+    self.assertEqual(count, 1)
+    self.assertEqual(len(json.loads(body)["samples"]), 1)
+
+  def test_too_large_batch_is_split(self) -> None:
+    buffer = self._buffer(12)
+    transport = FakeTransport(max_samples=3)
+
+    sent = send_buffered(buffer, transport, self.config, "host", LOGGER)
+    self.assertEqual(transport.attempts, [12, 6, 3])
+    self.assertEqual(transport.batches, [[0, 1, 2]])
+    self.assertEqual(sent, 3)
+    self.assertEqual(len(buffer), 9)
+    self.assertEqual(buffer.rejected, 0)
+
+  def test_refused_sample_is_dropped_once_per_call(self) -> None:
+    buffer = self._buffer(4)
+    transport = FakeTransport(poison={0})
+
+    with self.assertRaises(SampleRejected):
+      send_buffered(buffer, transport, self.config, "host", LOGGER)
+    self.assertEqual(transport.attempts, [4, 2, 1])
+    self.assertEqual(buffer.rejected, 1)
+    self.assertEqual(len(buffer), 3)
+
+    sent = send_buffered(buffer, transport, self.config, "host", LOGGER)
+    self.assertEqual(transport.batches, [[1, 2, 3]])
+    self.assertEqual(sent, 3)
+    self.assertEqual(len(buffer), 0)
+
+  def test_non_payload_client_errors_keep_samples(self) -> None:
+    for status in (401, 403, 404):
+      buffer = self._buffer(3)
+      transport = FakeTransport(failure=status)
+      with self.assertRaises(requests.HTTPError):
+        send_buffered(buffer, transport, self.config, "host", LOGGER)
+      self.assertEqual(transport.attempts, [3])
+      self.assertEqual(len(buffer), 3)
+      self.assertEqual(buffer.rejected, 0)
+
+  def test_transient_failure_keeps_samples(self) -> None:
+    for status in (500, 429):
+      buffer = self._buffer(3)
+      with self.assertRaises(requests.HTTPError):
+        send_buffered(buffer, FakeTransport(failure=status), self.config, "host", LOGGER)
+      self.assertEqual(len(buffer), 3)
+      self.assertEqual(buffer.rejected, 0)
+
+
+if __name__ == "__main__":
+  unittest.main()